@@ -36,7 +36,9 @@ class User(Base):
 
 from sqlalchemy import create_engine
 
-engine = create_engine("sqlite://")
+engine = create_engine(
+    "sqlite://", insertmanyvalues_page_size=1000, query_cache_size=500
+)
 
 with engine.begin() as conn:
     Base.metadata.create_all(conn)
@@ -45,6 +47,11 @@ with engine.begin() as conn:
 ### * Above, we can see the server default of "CURRENT_TIMESTAMP" generated for the created_at column
 ### * This will allow new date values to be generated for any INSERT statement encountered by the server which doesn't already include this column
 
+### slide:: bi
+### * We also spelled out two ``create_engine()`` options that matter for INSERTs (the values shown are the defaults):
+###     * ``query_cache_size`` - how many compiled SQL strings the ``Engine`` keeps, so a statement run again skips the compile step
+###     * ``insertmanyvalues_page_size`` - how many rows are batched into each multi-row ``INSERT..VALUES`` when many rows are INSERTed with RETURNING
+
 
 ### slide:: b
 ### title:: The insert() construct
@@ -98,14 +105,42 @@ with engine.begin() as conn:
 ### * The automatic generation of VALUES works by inspecting the keys within the first dictionary given
 ### * The convention of "keys match column names" is the same as that of the ``insert.values()`` method.
 
+rows = [
+    {"name": "sandy", "fullname": "Sandy Cheeks"},
+    {"name": "gary", "fullname": "Gary the Snail"},
+    {"name": "patrick", "fullname": "Patrick Star"},
+    {"name": "squidward", "fullname": "Squidward Tentacles"},
+]
+
+with engine.begin() as conn:
+    conn.execute(insert(User), rows)
+
+### slide:: bi
+### * All of the rows went to the database in a **single** ``.execute()`` call, inside a single transaction
+### * The DBAPI ``cursor.executemany()`` method is used for this, rather than one round trip per row
+### * Each value is bound using the datatype of its target column in the ``Table``, so there's no need to spell out ``bindparam()`` objects with types
+### * Whenever there are many rows to INSERT, send them together as a list like this, rather than calling ``.execute()`` in a loop
+
+### slide:: bp
+### title:: INSERT..RETURNING
+### * When we need values the database generated for the new rows, such as primary keys, we can get them back from the same statement using ``insert.returning()``
+### * This saves running a separate SELECT afterwards
+### * With a list of rows, these are batched into multi-row ``INSERT..VALUES..RETURNING`` statements, which SQLAlchemy calls "insertmanyvalues"
+
 with engine.begin() as conn:
-    conn.execute(
-        insert(User),
+    result = conn.execute(
+        insert(User).returning(User.id, User.name),
         [
-            {"name": "sandy", "fullname": "Sandy Cheeks"},
-            {"name": "gary", "fullname": "Gary the Snail"},
+            {"name": "pearl", "fullname": "Pearl Krabs"},
+            {"name": "krabs", "fullname": "Mr. Krabs"},
         ],
     )
+    new_users = result.all()
+
+### slide:: bi
+### * The RETURNING rows come back as a result, just like a SELECT
+
+new_users
 
 
 ### slide::
@@ -56,6 +56,16 @@ with engine.begin() as conn:
     )
 
 
+### slide:: b
+### title:: SELECT statements - a Connection to work with
+### * Real world code should use ``with engine.connect()`` blocks to manage the scope of each ``Connection``
+### * However, for the **purposes of example**, we will make a single ``Connection`` and leave it opened for this whole section
+### * Every statement that follows then runs on the same database connection
+### * We also give it a plain dictionary to use as its **compiled cache**, in place of the ``Engine``'s, so that we can look inside it later
+
+compiled_cache = {}
+connection = engine.connect().execution_options(compiled_cache=compiled_cache)
+
 ### slide:: b
 ### title:: SELECT statements
 ### * In the section on executing statements with an ``Engine``, we introduced the ``text()`` construct
@@ -66,9 +76,8 @@ stmt = text("SELECT name FROM user_account")
 ### slide:: bip
 ### * We illustrated how text() can be executed with ``connection.execute()`` in order to return a result set
 
-with engine.connect() as connection:
-    for row in connection.execute(stmt):
-        print(row.name)
+for row in connection.execute(stmt):
+    print(row.name)
 
 ### slide:: b
 ### title:: SELECT statements
@@ -83,14 +92,20 @@ stmt = select(User.name)
 
 print(stmt)
 
+### slide:: bi
+### * Stringifying a statement runs it through the SQL compiler every time, which is fine for having a look at it
+### * When a statement is **executed**, the compiled form is cached and re-used, so we don't need to pre-compile anything ourselves
+### * By default that cache belongs to the ``Engine``; our ``Connection`` here uses the ``compiled_cache`` dictionary we gave it instead
+
 
 ### slide:: bp
 ### title:: SELECT statements
 ### * As we did previously with ``text()``, we can run this statement using ``Connection.execute()``
+### * As there's only one column, ``Connection.scalars()`` gives us the values directly rather than rows
+### * ``.all()`` then fetches all of them in one go, which we print out all at once
 
-with engine.connect() as connection:
-    for row in connection.execute(stmt):
-        print(row.name)
+names = connection.scalars(stmt).all()
+print("\n".join(names))
 
 
 ### slide:: b
@@ -146,25 +161,23 @@ class Address(Base):
 ### * Putting it together we can get a structured display of both tables at once
 stmt = select(User.name, User.fullname, Address.email_address).join_from(User, Address)
 
-with engine.connect() as connection:
-    result = connection.execute(stmt)
-    for row in result:
-        print(f"{row.name:15} {row.fullname:25}  {row.email_address}")
+rows = connection.execute(stmt).all()
+print("\n".join(f"{row.name:15} {row.fullname:25}  {row.email_address}" for row in rows))
 
 ### slide:: bp
 ### title:: SELECT statements - we are...SELECTing!
 ### * Finally, there's a whole world of more complex SELECT statements using aliases, subqueries, etc.
 ### * Such as, "SELECT user names that have more than one email address"
 
+email_count = func.count(Address.email_address)
 email_address_count = (
-    select(Address.user_id, func.count(Address.email_address).label('email_count')).group_by(Address.user_id).
-    having(func.count(Address.email_address) > 1).subquery()
+    select(Address.user_id, email_count.label('email_count')).group_by(Address.user_id).
+    having(email_count > 1).subquery()
 )
 stmt = select(User.name, email_address_count.c.email_count).join_from(User, email_address_count)
 
-with engine.connect() as connection:
-    for row in connection.execute(stmt):
-        print(f"username: {row.name} | number of email addresses: {row.email_count}")
+rows = connection.execute(stmt).all()
+print("\n".join(f"username: {row.name} | number of email addresses: {row.email_count}" for row in rows))
 
 
 ### slide:: b
@@ -194,6 +207,41 @@ print(
 )
 
 
+### slide:: b
+### title:: WHERE criteria - named bound parameters
+### * A bound parameter can also be given an explicit name using ``bindparam()``, with the value supplied later when the statement is executed
+### * This way we build the statement **once**, then run it with as many different values as we like
+
+from sqlalchemy import bindparam
+
+stmt = select(User.fullname).where(User.name == bindparam("username"))
+print(stmt)
+
+### slide:: bip
+### * The values are passed to ``Connection.execute()`` as a dictionary
+### * The SQL echo shows the SQL string being compiled the first time ("generated in"), then pulled from our ``compiled_cache`` dictionary for each run after that ("cached since")
+
+for username in ["spongebob", "sandy", "patrick"]:
+    print(connection.execute(stmt, {"username": username}).scalar())
+
+### slide:: bi
+### * The compiled cache we gave our ``Connection`` has one entry for each distinct statement we've run so far; the three runs above share a single entry
+
+len(compiled_cache)
+
+### slide:: bip
+### * A statement that will only ever run once can skip the cache, by setting ``compiled_cache`` to ``None`` for that one execution
+### * The SQL echo then reports "caching disabled", and nothing new is added to our dictionary
+
+print(
+    connection.execute(
+        select(User.fullname).where(User.name == "pearl"),
+        execution_options={"compiled_cache": None},
+    ).scalar()
+)
+len(compiled_cache)
+
+
 ### slide:: b
 ### title:: SELECT statements - limiting rows with WHERE criteria
 ### * less than, greater than
@@ -217,6 +265,48 @@ print(
     .compile(compile_kwargs={"literal_binds": True})
 )
 
+### slide:: bi
+### * IN can also be given a single **expanding** ``bindparam()``, where the list of values is supplied at execution time
+### * The statement then stays the same no matter how many values are in the list; the individual parameters are rendered only when it runs
+
+names_criteria = User.name.in_(bindparam("names", expanding=True))
+print(names_criteria)
+
+### slide:: bip
+### * The same statement can be run with a list of any size, even an empty one
+
+names_stmt = select(User.name).where(names_criteria)
+
+print(connection.scalars(names_stmt, {"names": ["sandy", "krabs", "spongebob"]}).all())
+print(connection.scalars(names_stmt, {"names": []}).all())
+
+### slide:: bip
+### * An empty list renders a comparison that is always false, so no rows can come back
+### * When our own code already knows the list is empty, it can skip the round trip to the database entirely
+### * Below, the call with names runs the statement as before, while the call with an empty list emits no SQL at all in the echo
+
+def select_names(names):
+    if not names:
+        return []
+    return connection.scalars(names_stmt, {"names": names}).all()
+
+print(select_names(["sandy", "krabs"]))
+print(select_names([]))
+
+
+### slide:: b
+### title:: SELECT statements - limiting rows with WHERE criteria
+### * AND and OR, using ``and_()`` and ``or_()``
+
+from sqlalchemy import and_, or_
+
+spongebob_or_patrick = or_(User.name == "spongebob", User.name == "patrick")
+print(spongebob_or_patrick)
+
+### slide:: bi
+### * Like any other expression, a conjunction that's built once can be used as part of more expressions later on
+
+print(and_(User.fullname.is_not(None), spongebob_or_patrick))
 
 
 ### slide:: b
@@ -231,6 +321,12 @@ print(stmt)
 stmt = stmt.where(User.id > 1)
 print(stmt)
 
+### slide:: bi
+### * ``.where()`` also accepts any number of criteria at once, producing the same statement in one step
+
+stmt = select(User.name).where(User.name.in_(["spongebob", "sandy", "krabs"]), User.id > 1)
+print(stmt)
+
 ### slide:: b
 ### title:: WHERE criteria, ORDER BY, etc.
 ### * expressions also go into other methods like ORDER BY via the ``.order_by()`` method
@@ -246,10 +342,33 @@ stmt = stmt.add_columns(literal("full name: ") + User.fullname)
 
 ### slide:: bip
 ### * Running the statement we see it all together
+### * ``+`` between string expressions renders as the SQL ``||`` operator, so the concatenation is done by the database as rows are produced
+
+rows = connection.execute(stmt).all()
+print("\n".join(f"name: {name:15} {fullname}" for name, fullname in rows))
+
+
+### slide:: b
+### title:: SELECT statements - lambda statements
+### * A statement can also be produced by a Python lambda, using ``lambda_stmt()``
+### * SQLAlchemy caches the result of the lambda keyed on the lambda's code, so code that produces the same statement over and over (like inside a function) skips **building** the ``select()`` as well as compiling it
+
+from sqlalchemy import lambda_stmt
+
+stmt = lambda_stmt(lambda: select(User.name).order_by(User.name))
+
+### slide:: bip
+### * Lambda statements are executed just like any other statement
+
+print(connection.scalars(stmt).all())
+
+
+### slide:: bp
+### title:: SELECT statements - done with our Connection
+### * We're finished with the ``Connection`` we kept open for this section, so we close it
+### * This ends its transaction and **releases** the DBAPI connection back to the connection pool
 
-with engine.connect() as conn:
-    for name, fullname in conn.execute(stmt):
-        print(f"name: {name:15} {fullname}")
+connection.close()
 
 
 ### slide:: b